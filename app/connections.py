@@ -270,16 +270,17 @@ class UtfFTP(FTP):
         resp = "200"
         msg = "Uploading directory: {}.   Status: {}"
         try:
-            files = os.listdir(path)
+            with os.scandir(path) as it:
+                entries = [(e.name, e.is_file(), e.is_dir()) for e in it]
         except OSError as e:
             log(e)
         else:
             os.chdir(path)
-            for f in files:
+            for f, is_file, is_dir in entries:
                 file = r"{}{}".format(path, f)
-                if os.path.isfile(file):
+                if is_file:
                     self.send_file(f, path, callback)
-                elif os.path.isdir(file):
+                elif is_dir:
                     try:
                         self.mkd(f)
                     except Error:
@@ -553,6 +554,7 @@ class HttpAPI:
      """
 
     _CONTENT_HEADER = "application/x-www-form-urlencoded"
+    _TRANSFER_TIMEOUT = 15000  # ms
 
     class Request(str, Enum):
         ZAP = "zap?sRef="
@@ -613,11 +615,10 @@ class HttpAPI:
 
     def __init__(self, settings, callbacks={}):
         self._is_owif = True
-        host, use_ssl, port = settings["host"], settings["http_use_ssl"], settings["http_port"]
-        self._base_url = f"http{'s' if use_ssl else ''}://{host}:{port}/"
-        self._main_url = f"http{'s' if use_ssl else ''}://{host}:{port}/web/"
-        self._settings = settings
-        self._use_ssl = use_ssl
+        self._base_url = ""
+        self._main_url = ""
+        self._settings = None
+        self._use_ssl = False
         self._callbacks = callbacks
         # SSL
         self._ssl_config = QSslConfiguration.defaultConfiguration()
@@ -628,6 +629,25 @@ class HttpAPI:
         self.network_manager = QNetworkAccessManager()
         self.network_manager.authenticationRequired.connect(self.auth)
         self.network_manager.finished.connect(self.handle_response)
+        self.set_profile(settings)
+
+    def set_profile(self, settings):
+        """ Applies the profile settings. The network manager [and its open connections] is kept. """
+        if self._main_url and settings == self._settings:
+            return
+
+        if self._settings:
+            # Connections and credentials of the previous profile.
+            self.network_manager.clearAccessCache()
+
+        self._is_owif = True
+        host, use_ssl, port = settings["host"], settings["http_use_ssl"], settings["http_port"]
+        self._base_url = f"http{'s' if use_ssl else ''}://{host}:{port}/"
+        self._main_url = f"http{'s' if use_ssl else ''}://{host}:{port}/web/"
+        self._settings = dict(settings)
+        self._use_ssl = use_ssl
+        self._auth = 0
+        self._token = b"sessionid=0"
 
     def auth(self, reply, auth):
         self._auth += 1
@@ -648,6 +668,9 @@ class HttpAPI:
         request = QNetworkRequest(QUrl(f"{url}{req}{params if params else ''}"))
         request.setSslConfiguration(self._ssl_config)
         request.setAttribute(request.CustomVerbAttribute, req)
+        if hasattr(request, "setTransferTimeout"):
+            # Qt >= 5.15. A stalled request ends with an error reply.
+            request.setTransferTimeout(self._TRANSFER_TIMEOUT)
         if req is HttpAPI.Request.GRUB:
             request.setHeader(QNetworkRequest.ContentTypeHeader, "image/jpeg")
         else:
@@ -655,6 +678,7 @@ class HttpAPI:
         self.network_manager.post(request, self._token)
 
     def handle_response(self, reply):
+        reply.deleteLater()  # Releases the reply [the connection stays in the manager pool].
         req = reply.request().attribute(QNetworkRequest.CustomVerbAttribute)
         callback = self._callbacks.get(req)
         er = reply.error()
@@ -662,7 +686,7 @@ class HttpAPI:
             return
 
         if er == QNetworkReply.NoError:
-            if req is HttpAPI.Request.STREAM or type is HttpAPI.Request.STREAM_CURRENT:
+            if req is HttpAPI.Request.STREAM or req is HttpAPI.Request.STREAM_CURRENT:
                 callback({"m3u": reply.readAll()})
             elif req is HttpAPI.Request.GRUB:
                 callback({"img_data": reply.readAll()})
@@ -38,7 +38,7 @@ def backup_data(path, backup_path, move=True):
     os.makedirs(os.path.dirname(backup_path), exist_ok=True)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     # Backup files in data dir(skipping dirs and *.xml)
-    for file in filter(lambda f: f not in _XML_DATA and os.path.isfile(os.path.join(path, f)), os.listdir(path)):
+    for file in get_data_files(path):
         src, dst = os.path.join(path, file), backup_path + file
         shutil.move(src, dst) if move else shutil.copy(src, dst)
     # Compressing to zip and delete remaining files.
@@ -56,9 +56,15 @@ def restore_data(src, dst):
 
 def clear_data_path(path):
     """ Clearing data at the specified path excluding *.xml file. """
-    for file in filter(lambda f: f not in _XML_DATA and os.path.isfile(os.path.join(path, f)), os.listdir(path)):
+    for file in get_data_files(path):
         os.remove(os.path.join(path, file))
 
 
+def get_data_files(path):
+    """ Returns a list of file names at the specified path excluding dirs and *.xml files. """
+    with os.scandir(path) as it:
+        return [e.name for e in it if e.name not in _XML_DATA and e.is_file()]
+
+
 if __name__ == "__main__":
     pass
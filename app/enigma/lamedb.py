@@ -23,6 +23,7 @@
 
 """   This module used for parsing and write lamedb file.   """
 import re
+import sys
 
 from app.commons import log
 from app.ui.uicommons import CODED_ICON, LOCKED_ICON, HIDE_ICON
@@ -165,14 +166,20 @@ class LameDbReader:
             picon_id = f"1_0_{srv_type:X}_{ssid}_{tid}_{nid}_{onid}_0_0_0.png"
             s_id = f"1:0:{srv_type:X}:{ssid}:{tid}:{nid}:{onid}:0:0:0:"
 
-            all_flags = srv[2].split(",")
-            coded = CODED_ICON if list(filter(lambda x: x.startswith("C:"), all_flags)) else None
-            flags = list(filter(lambda x: x.startswith("f:"), all_flags))
-            hide = HIDE_ICON if flags and Flag.is_hide(Flag.parse(flags[0])) else None
+            # Flags. Single pass.
+            coded, f_flag, package = None, None, None
+            for flag in srv[2].split(","):
+                prefix = flag[:2]
+                if prefix == "C:":
+                    coded = CODED_ICON
+                elif prefix == "f:":
+                    f_flag = f_flag or flag
+                elif prefix == "p:" and package is None:
+                    package = flag[2:]
+
+            hide = HIDE_ICON if f_flag and Flag.is_hide(Flag.parse(f_flag)) else None
             locked = LOCKED_ICON if s_id in blacklist else None
-
-            package = list(filter(lambda x: x.startswith("p:"), all_flags))
-            package = package[0][2:] if package else ""
+            package = sys.intern(package) if package else ""  # Shared by many services.
 
             if transponder is not None:
                 tr_type, sp, tr = str(transponder).partition(" ")
@@ -180,7 +187,7 @@ class LameDbReader:
                 tr = tr.split(_SEP)
                 service_type = SERVICE_TYPE.get(data[4], SERVICE_TYPE["-2"])
                 # Removing all non-printable symbols!
-                srv_name = "".join(c for c in srv[1] if c.isprintable())
+                srv_name = srv[1] if srv[1].isprintable() else "".join(c for c in srv[1] if c.isprintable())
                 freq = tr[0]
                 rate = tr[1]
                 pol = None
@@ -21,6 +21,7 @@
 #
 
 
+import importlib
 import sys
 
 from PyQt5.QtCore import QObject, pyqtSignal
@@ -93,6 +94,28 @@ class Player(QObject):
         else:
             raise NameError("There is no such [{}] implementation.".format(name))
 
+    @staticmethod
+    def preload(name):
+        """ Imports the libraries of the given implementation in advance.
+
+            Used to reduce the delay of the first playback start.
+            Errors are only logged and will be raised again by the [make] method.
+        """
+        try:
+            if name == "MPV":
+                importlib.import_module("app.streams.mpv")
+            elif name == "GStreamer":
+                import gi
+
+                gi.require_version("Gst", "1.0")
+                gi.require_version("GstVideo", "1.0")
+                importlib.import_module("gi.repository.Gst")
+                importlib.import_module("gi.repository.GstVideo")
+            elif name == "VLC":
+                importlib.import_module("app.streams.vlc")
+        except (ImportError, OSError, ValueError) as e:
+            log(f"Player preload error: {e}")
+
 
 class MpvPlayer(Player):
     """ Simple wrapper for MPV media player.
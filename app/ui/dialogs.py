@@ -44,6 +44,21 @@ from app.ui.models import ServiceTypeModel
 from app.ui.uicommons import UI_PATH
 from app.ui.views import BackupFileView
 
+# PID's flag prefixes.
+_PID_VIDEO = Pids.VIDEO.value
+_PID_AUDIO = Pids.AUDIO.value
+_PID_TELETEXT = Pids.TELETEXT.value
+_PID_PCR = Pids.PCR.value
+_PID_AC3 = Pids.AC3.value
+_PID_VIDEO_TYPE = Pids.VIDEO_TYPE.value
+_PID_AUDIO_CHANNEL = Pids.AUDIO_CHANNEL.value
+_PID_BIT_STREAM_DELAY = Pids.BIT_STREAM_DELAY.value
+_PID_PCM_DELAY = Pids.PCM_DELAY.value
+_PID_SUBTITLE = Pids.SUBTITLE.value
+# Compiled UI forms. Loaded once on import instead of on each dialog opening.
+_ServiceDialogForm, _ = uic.loadUiType(f"{UI_PATH}service_dialog.ui")
+_IptvServiceDialogForm, _ = uic.loadUiType(f"{UI_PATH}iptv_service_dialog.ui")
+
 
 class TimerDialog(QtWidgets.QDialog):
     class TimerAction(IntEnum):
@@ -231,10 +246,10 @@ class TimerDialog(QtWidgets.QDialog):
         self.timer_location_label.setText(_translate("timer_dialog", "Location:"))
 
 
-class ServiceDialog(QtWidgets.QDialog):
+class ServiceDialog(QtWidgets.QDialog, _ServiceDialogForm):
     def __init__(self, service, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        uic.loadUi(f"{UI_PATH}service_dialog.ui", self)
+        self.setupUi(self)
         # Types.
         self.type_combo_box.setModel(ServiceTypeModel(self.type_combo_box))
         self.type_combo_box.currentTextChanged.connect(self.update_reference_entry)
@@ -292,7 +307,7 @@ class ServiceDialog(QtWidgets.QDialog):
         self.update_reference_entry()
 
     def init_flags(self, flags):
-        f_flags = list(filter(lambda x: x.startswith("f:"), flags))
+        f_flags = [f for f in flags if f[:2] == "f:"]
         if f_flags:
             value = Flag.parse(f_flags[0])
             self.keep_flag_check_box.setChecked(Flag.is_keep(value))
@@ -301,36 +316,37 @@ class ServiceDialog(QtWidgets.QDialog):
             self.new_flag_check_box.setChecked(Flag.is_new(value))
 
     def init_cas(self, flags):
-        cas = list(filter(lambda x: x.startswith("C:"), flags))
+        cas = [f for f in flags if f[:2] == "C:"]
         if cas:
             self.caids_edit.setText(",".join(cas))
 
     def init_pids(self, flags):
-        pids = list(filter(lambda x: x.startswith("c:"), flags))
+        pids = [f for f in flags if f[:2] == "c:"]
         if pids:
             extra_pids = []
             for pid in pids:
-                if pid.startswith(Pids.VIDEO.value):
+                prefix = pid[:4]
+                if prefix == _PID_VIDEO:
                     self.video_pid_edit.setText(str(int(pid[4:], 16)))
-                elif pid.startswith(Pids.AUDIO.value):
+                elif prefix == _PID_AUDIO:
                     self.audio_pid_edit.setText(str(int(pid[4:], 16)))
-                elif pid.startswith(Pids.TELETEXT.value):
+                elif prefix == _PID_TELETEXT:
                     self.teletext_pid_edit.setText(str(int(pid[4:], 16)))
-                elif pid.startswith(Pids.PCR.value):
+                elif prefix == _PID_PCR:
                     self.pcr_pid_edit.setText(str(int(pid[4:], 16)))
-                elif pid.startswith(Pids.AC3.value):
+                elif prefix == _PID_AC3:
                     self.ac3_pid_edit.setText(str(int(pid[4:], 16)))
-                elif pid.startswith(Pids.VIDEO_TYPE.value):
+                elif prefix == _PID_VIDEO_TYPE:
                     extra_pids.append(pid)
-                elif pid.startswith(Pids.AUDIO_CHANNEL.value):
+                elif prefix == _PID_AUDIO_CHANNEL:
                     extra_pids.append(pid)
-                elif pid.startswith(Pids.BIT_STREAM_DELAY.value):
+                elif prefix == _PID_BIT_STREAM_DELAY:
                     # str(int(pid[4:], 16)))
                     pass
-                elif pid.startswith(Pids.PCM_DELAY.value):
+                elif prefix == _PID_PCM_DELAY:
                     # str(int(pid[4:], 16))
                     pass
-                elif pid.startswith(Pids.SUBTITLE.value):
+                elif prefix == _PID_SUBTITLE:
                     extra_pids.append(pid)
                 else:
                     extra_pids.append(pid)
@@ -367,22 +383,22 @@ class ServiceDialog(QtWidgets.QDialog):
         # Pids.
         video_pid = self.video_pid_edit.text()
         if video_pid:
-            flags.append(f"{Pids.VIDEO.value}{int(video_pid):04x}")
+            flags.append(f"{_PID_VIDEO}{int(video_pid):04x}")
         audio_pid = self.audio_pid_edit.text()
         if audio_pid:
-            flags.append(f"{Pids.AUDIO.value}{int(audio_pid):04x}")
+            flags.append(f"{_PID_AUDIO}{int(audio_pid):04x}")
         teletext_pid = self.teletext_pid_edit.text()
         if teletext_pid:
-            flags.append(f"{Pids.TELETEXT.value}{int(teletext_pid):04x}")
+            flags.append(f"{_PID_TELETEXT}{int(teletext_pid):04x}")
         pcr_pid = self.pcr_pid_edit.text()
         if pcr_pid:
-            flags.append(f"{Pids.PCR.value}{int(pcr_pid):04x}")
+            flags.append(f"{_PID_PCR}{int(pcr_pid):04x}")
         ac3_pid = self.ac3_pid_edit.text()
         if ac3_pid:
-            flags.append(f"{Pids.AC3.value}{int(ac3_pid):04x}")
+            flags.append(f"{_PID_AC3}{int(ac3_pid):04x}")
         pcm_pid = self.pcr_pid_edit.text()
         if pcm_pid:
-            flags.append(f"{Pids.PCM_DELAY.value}{int(pcm_pid):04x}")
+            flags.append(f"{_PID_PCM_DELAY}{int(pcm_pid):04x}")
         extra_pids = self.extra_edit.text()
         if extra_pids:
             flags.append(extra_pids)
@@ -432,8 +448,8 @@ class ServiceDialog(QtWidgets.QDialog):
         self.new_flag_check_box.setText(_translate("service_dialog", "New"))
 
 
-class IptvServiceDialog(QtWidgets.QDialog):
-    _ENIGMA2_REFERENCE = "{}:0:{}:{:X}:{:X}:{:X}:{:X}:0:0:0"
+class IptvServiceDialog(QtWidgets.QDialog, _IptvServiceDialogForm):
+    _ENIGMA2_REFERENCE = "{st}:0:{dvb}:{ssid:X}:{tid:X}:{nid:X}:{ns:X}:0:0:0"
 
     class UrlValidator(QtGui.QRegExpValidator):
         def __init__(self, *args, **kwargs):
@@ -452,7 +468,9 @@ class IptvServiceDialog(QtWidgets.QDialog):
 
     def __init__(self, service=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        uic.loadUi(f"{UI_PATH}iptv_service_dialog.ui", self)
+        self.setupUi(self)
+        # Reference args. Reused on each reference update.
+        self._ref_args = {}
         # Values validation.
         self.url_edit.setValidator(self.UrlValidator(self.url_edit))
         self.dvb_type_edit.setValidator(QtGui.QIntValidator(self.dvb_type_edit))
@@ -472,11 +490,10 @@ class IptvServiceDialog(QtWidgets.QDialog):
         self._service = service
         self._desc = None
         self.init_service_data() if service else self.init_new_service_data()
-        # Update reference
+        # Update reference. Live only for SID, the rest on editing finish.
         self.sid_edit.textChanged.connect(self.update_reference_entry)
-        self.tid_edit.textChanged.connect(self.update_reference_entry)
-        self.nid_edit.textChanged.connect(self.update_reference_entry)
-        self.namespace_edit.textChanged.connect(self.update_reference_entry)
+        for edit in (self.dvb_type_edit, self.tid_edit, self.nid_edit, self.namespace_edit):
+            edit.editingFinished.connect(self.update_reference_entry)
 
     @property
     def service(self):
@@ -548,13 +565,12 @@ class IptvServiceDialog(QtWidgets.QDialog):
         super().accept()
 
     def update_reference_entry(self):
-        stream_type = self.type_combo_box.model().index(self.type_combo_box.currentIndex(), 1).data()
-        self.ref_edit.setText(self._ENIGMA2_REFERENCE.format(stream_type,
-                                                             self.dvb_type_edit.text(),
-                                                             int(self.sid_edit.text() or 0),
-                                                             int(self.tid_edit.text() or 0),
-                                                             int(self.nid_edit.text() or 0),
-                                                             int(self.namespace_edit.text() or 0)))
+        args = self._ref_args
+        args["st"] = self.type_combo_box.model().index(self.type_combo_box.currentIndex(), 1).data()
+        args["dvb"] = self.dvb_type_edit.text()
+        args["ssid"], args["tid"] = int(self.sid_edit.text() or 0), int(self.tid_edit.text() or 0)
+        args["nid"], args["ns"] = int(self.nid_edit.text() or 0), int(self.namespace_edit.text() or 0)
+        self.ref_edit.setText(self._ENIGMA2_REFERENCE.format_map(args))
 
     def is_data_correct(self):
         url_validator = self.url_edit.validator()
@@ -23,14 +23,22 @@
 
 """ Main UI module. """
 import os
+import shutil
 import sys
-from collections import OrderedDict, Counter, defaultdict
+import tarfile
+import tempfile
+import time
+import zipfile
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from functools import lru_cache
 from ftplib import all_errors
+from operator import attrgetter
 from pathlib import Path
 from urllib.parse import quote
 
-from PyQt5.QtCore import QTranslator, QStringListModel, QTimer, pyqtSlot, Qt, QFile, QDir
+from PyQt5.QtCore import (QTranslator, QStringListModel, QTimer, pyqtSlot, Qt, QFile, QDir, QThread, pyqtSignal,
+                          QItemSelection, QEvent)
 from PyQt5.QtGui import QIcon, QStandardItem, QPixmap
 from PyQt5.QtWidgets import QApplication, QMessageBox, QFileDialog, QActionGroup, QAction
 
@@ -43,12 +51,34 @@ from app.enigma.ecommons import (BqServiceType, Service, Bouquet, Bouquets, BqTy
                                  Transponder)
 from app.enigma.lamedb import LameDbWriter, LameDbReader
 from app.satellites.satxml import get_satellites, write_satellites
-from app.streams.iptv import import_m3u
 from app.ui.dialogs import *
 from app.ui.settings import SettingsDialog, Settings
 from app.ui.uicommons import Column, IPTV_ICON, LOCKED_ICON, BqGenType, LANG_PATH
 from .ui import MainUiWindow, Page
 
+_MARKER_TYPES = frozenset((BqServiceType.MARKER.name, BqServiceType.SPACE.name, BqServiceType.ALT.name))
+# File dialogs. Skips the custom icons lookup and symlinks resolving [slow on network mounts].
+_FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+_DIR_DIALOG_OPTIONS = _FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly
+
+
+# Localized weekday names [Monday first].
+_WEEKDAYS = tuple(datetime(2023, 1, d).strftime("%A") for d in range(2, 9))
+
+
+@lru_cache(maxsize=4096)
+def _get_local_time(minute):
+    """ Returns (weekday, hour, minute) for the given timestamp in minutes. """
+    t = datetime.fromtimestamp(minute * 60)
+    return _WEEKDAYS[t.weekday()], t.hour, t.minute
+
+
+def _get_time_header(start, end):
+    """ Returns time header string [start - end] for EPG events and timers. """
+    day, s_hour, s_min = _get_local_time(start // 60)
+    __, e_hour, e_min = _get_local_time(end // 60)
+    return f"{day}, {s_hour:02d}:{s_min:02d} - {e_hour:02d}:{e_min:02d}"
+
 
 class Application(QApplication):
     def __init__(self, argv: sys.argv):
@@ -80,46 +110,215 @@ class Application(QApplication):
         self.settings.app_locale = locale
 
 
+class DataReader(QThread):
+    """ Class for reading bouquets and services data in a separate thread. """
+    loaded = pyqtSignal(object, object)  # -> (bouquets, services)
+    error_message = pyqtSignal(str)
+
+    def __init__(self, path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._path = path
+
+    def run(self):
+        try:
+            bouquets = BouquetsReader(self._path).get()
+            services = LameDbReader(self._path).parse()
+        except FileNotFoundError as e:
+            log(e)
+            self.error_message.emit(str(e))
+        else:
+            self.loaded.emit(bouquets, services)
+
+
+class SatellitesReader(QThread):
+    """ Class for reading satellites data in a separate thread. """
+    loaded = pyqtSignal(object)  # -> satellites list
+
+    def __init__(self, path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._path = path
+
+    def run(self):
+        try:
+            satellites = get_satellites(self._path)
+        except FileNotFoundError as e:
+            log(e)
+            satellites = []
+        self.loaded.emit(satellites)
+
+
+class PlayerLoader(QThread):
+    """ Class for importing the media player libraries in a separate thread. """
+
+    def __init__(self, name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._name = name
+
+    def run(self):
+        from app.streams.media import Player
+
+        Player.preload(self._name)
+
+
+class PiconScanner(QThread):
+    """ Class for listing picon files in a separate thread. """
+    loaded = pyqtSignal(object)  # -> list of (name, path)
+
+    def __init__(self, path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._path = path
+
+    def run(self):
+        try:
+            with os.scandir(self._path) as it:
+                files = [(e.name, e.path) for e in it if e.name.endswith(".png")]
+        except OSError:
+            return  # No picons dir.
+
+        self.loaded.emit(files)
+
+
+class ArchiveExtractor(QThread):
+    """ Class for extracting the data archive to a temp dir in a separate thread. """
+    extracted = pyqtSignal(object)  # -> TemporaryDirectory
+    error_message = pyqtSignal(str)
+
+    _BUFFER_SIZE = 256 * 1024
+    # Archive signatures.
+    _ZIP_MAGIC = b"PK\x03\x04"
+    _GZIP_MAGIC = b"\x1f\x8b"
+    _TAR_MAGIC = b"ustar"
+
+    def __init__(self, data_path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._data_path = data_path
+
+    def run(self):
+        tmp_path = tempfile.TemporaryDirectory()
+        tmp_path_name = tmp_path.name
+
+        try:
+            with open(self._data_path, "rb") as f:
+                header = f.read(262)
+
+            if header[:4] == self._ZIP_MAGIC:
+                with zipfile.ZipFile(self._data_path) as zip_file:
+                    for zip_info in zip_file.infolist():
+                        if not zip_info.is_dir():
+                            with zip_file.open(zip_info) as src:
+                                self.write_file(src, tmp_path_name, zip_info.filename)
+            elif header[:2] == self._GZIP_MAGIC or header[257:262] == self._TAR_MAGIC:
+                with tarfile.open(self._data_path) as tar:
+                    for mb in tar.getmembers():
+                        if mb.isfile():
+                            with tar.extractfile(mb) as src:
+                                self.write_file(src, tmp_path_name, mb.name)
+            else:
+                tmp_path.cleanup()
+                log(f"Error getting the path for the archive. Unsupported file format: {self._data_path}")
+                self.error_message.emit(self.tr("Unsupported format!"))
+                return
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            tmp_path.cleanup()
+            log(f"Error extracting the archive: {e}")
+            self.error_message.emit(str(e))
+        else:
+            self.extracted.emit(tmp_path)
+
+    def write_file(self, src, path, name):
+        """ Writes file data by chunks to the given path. """
+        with open(os.path.join(path, os.path.basename(name)), "wb") as dst:
+            shutil.copyfileobj(src, dst, self._BUFFER_SIZE)
+
+
 class MainWindow(MainUiWindow):
     """ The main UI class. """
+    # EPG cache.
+    _EPG_CACHE_TTL = 60
+    _EPG_CACHE_SIZE = 500
+    # Large bouquets are appended to the FAV view in chunks.
+    _FAV_CHUNK_SIZE = 500
+    _FAV_CHUNK_THRESHOLD = 2000
+    # State polling intervals [ms].
+    _STATE_INTERVAL = 3000
+    _STATE_MAX_INTERVAL = 30000
 
     def __init__(self):
         super(MainWindow, self).__init__()
         # Settings.
         self.settings = Settings()
         self._profiles = OrderedDict()
+        # Current profile and its paths.
+        self._current_profile = None
+        self._data_path = ""
+        self._picon_path = ""
+        self._backup_path = ""
         # Cached data.
-        self._bq_selected = ""
+        self._bq_selected = None  # -> (name, type)
         self._bouquets = {}
         self._bq_file = {}
         self._extra_bouquets = {}
         self._services = {}
+        self._services_counter = Counter()  # service type -> count in the services list
         self._blacklist = set()
         self._alt_file = set()
-        self._marker_types = {BqServiceType.MARKER.name,
-                              BqServiceType.SPACE.name,
-                              BqServiceType.ALT.name}
+        self._srv_info_cache = {}  # fav_id -> (service, info)
+        self._srv_info_tmp = ""
+        # Bouquets root icons.
+        self._tv_icon = QIcon.fromTheme("tv-symbolic")
+        self._radio_icon = QIcon.fromTheme("radio-symbolic")
+        self._data_reader = None
+        self._sat_reader = None
+        self._last_bouquet = None
+        self._picon_scanners = {}  # model -> scanner
+        self._fav_pending = []  # services not yet appended to the FAV view
+        self._fav_append_timer = QTimer(self)
+        self._fav_append_timer.setSingleShot(True)
+        self._fav_append_timer.setInterval(0)
         # HTTP API.
-        self._update_state_timer = QTimer(self)
+        self._update_state_timer = QTimer(self)  # Restarted by each state request and reply.
+        self._update_state_timer.setSingleShot(True)
+        self._state_request_pending = False
+        self._state_request_time = 0  # monotonic time of the last state request
+        self._state_interval = self._STATE_INTERVAL
+        self._last_state = None
         self._http_api = None
+        # EPG. Coalesces requests on fast selection changes.
+        self._epg_ref = None
+        self._epg_cache = OrderedDict()  # ref -> (time, epg)
+        self._epg_request_timer = QTimer(self)
+        self._epg_request_timer.setSingleShot(True)
+        self._epg_request_timer.setInterval(150)
+        # Volume. Only the last value is sent while the dial is being dragged.
+        self._volume_value = None
+        self._volume_timer = QTimer(self)
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(50)
         # Search.
         self.service_search_timer = QTimer(self)
         self.service_search_timer.setSingleShot(True)
         self.service_search_timer.setInterval(1000)
         # Streams.
         self._player = None
+        self._player_loader = None
+        self._audio_tracks = None
+        self._subtitle_tracks = None
         # FTP.
         self._ftp = None
         # Initialization.
+        self.init_srv_info_template()
         self.init_ui()
         self.init_language()
         self.init_profiles()
         self.init_actions()
         self.init_http_api()
         self.init_last_config()
+        # Preloading the player libraries after the window is shown.
+        QTimer.singleShot(0, self.preload_player)
 
     def init_ui(self):
         self.resize(self.settings.app_window_size)
+        self.profile_combo_box.setModel(QStringListModel(self))
         # View.
         if self.settings.alternate_layout:
             self.alternate_layout_action.setChecked(self.settings.alternate_layout)
@@ -160,6 +359,7 @@ class MainWindow(MainUiWindow):
         self.fav_view.insert_space.connect(self.insert_space)
         self.fav_view.removed.connect(self.remove_favorites)
         self.fav_view.inserted.connect(self.on_fav_data_changed)
+        self.fav_view.drag_entered.connect(self.finish_fav_loading)
         self.fav_view.picon_assigned.connect(lambda d: self.copy_picons(*d))
         self.services_view.edited.connect(lambda r: self.on_service_edit(r, self.services_view.model()))
         self.services_view.removed.connect(self.remove_services)
@@ -209,30 +409,34 @@ class MainWindow(MainUiWindow):
         self.epg_view.timer_add.connect(self.on_timer_add_from_event)
         self.epg_add_timer_button.clicked.connect(self.on_timer_add_from_event)
         # Remote controller actions.
-        self.control_up_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.UP))
-        self.control_down_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.DOWN))
-        self.control_left_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.LEFT))
-        self.control_right_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.RIGHT))
-        self.control_ok_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.OK))
-        self.control_menu_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.MENU))
-        self.control_exit_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.EXIT))
-        self.control_info_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.INFO))
-        self.control_back_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.BACK))
-        self.red_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.RED))
-        self.green_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.GREEN))
-        self.yellow_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.YELLOW))
-        self.blue_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.BLUE))
-        # Media
-        self.media_prev_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.PLAYER_PREV))
-        self.media_next_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.PLAYER_NEXT))
-        self.media_play_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.PLAYER_PLAY))
-        self.media_stop_button.clicked.connect(lambda b: self.on_remote_action(HttpAPI.Remote.PLAYER_STOP))
+        self._remote_actions = {self.control_up_button: HttpAPI.Remote.UP,
+                                self.control_down_button: HttpAPI.Remote.DOWN,
+                                self.control_left_button: HttpAPI.Remote.LEFT,
+                                self.control_right_button: HttpAPI.Remote.RIGHT,
+                                self.control_ok_button: HttpAPI.Remote.OK,
+                                self.control_menu_button: HttpAPI.Remote.MENU,
+                                self.control_exit_button: HttpAPI.Remote.EXIT,
+                                self.control_info_button: HttpAPI.Remote.INFO,
+                                self.control_back_button: HttpAPI.Remote.BACK,
+                                self.red_button: HttpAPI.Remote.RED,
+                                self.green_button: HttpAPI.Remote.GREEN,
+                                self.yellow_button: HttpAPI.Remote.YELLOW,
+                                self.blue_button: HttpAPI.Remote.BLUE,
+                                # Media
+                                self.media_prev_button: HttpAPI.Remote.PLAYER_PREV,
+                                self.media_next_button: HttpAPI.Remote.PLAYER_NEXT,
+                                self.media_play_button: HttpAPI.Remote.PLAYER_PLAY,
+                                self.media_stop_button: HttpAPI.Remote.PLAYER_STOP}
+        for button in self._remote_actions:
+            button.clicked.connect(self.on_remote_button_clicked)
         # Power
-        self.power_standby_button.clicked.connect(lambda b: self.on_power_action(HttpAPI.Power.STANDBY))
-        self.power_wake_up_button.clicked.connect(lambda b: self.on_power_action(HttpAPI.Power.WAKEUP))
-        self.power_reboot_button.clicked.connect(lambda b: self.on_power_action(HttpAPI.Power.REBOOT))
-        self.power_restart_gui_button.clicked.connect(lambda b: self.on_power_action(HttpAPI.Power.RESTART_GUI))
-        self.power_shutdown_button.clicked.connect(lambda b: self.on_power_action(HttpAPI.Power.DEEP_STANDBY))
+        self._power_actions = {self.power_standby_button: HttpAPI.Power.STANDBY,
+                               self.power_wake_up_button: HttpAPI.Power.WAKEUP,
+                               self.power_reboot_button: HttpAPI.Power.REBOOT,
+                               self.power_restart_gui_button: HttpAPI.Power.RESTART_GUI,
+                               self.power_shutdown_button: HttpAPI.Power.DEEP_STANDBY}
+        for button in self._power_actions:
+            button.clicked.connect(self.on_power_button_clicked)
         # Screenshots
         self.screenshot_all_button.clicked.connect(self.on_screenshot_all)
         self.screenshot_video_button.clicked.connect(self.on_screenshot_video)
@@ -241,6 +445,9 @@ class MainWindow(MainUiWindow):
         self.control_volume_dial.valueChanged.connect(self.on_volume_changed)
         # HTTP API.
         self._update_state_timer.timeout.connect(self.update_state)
+        self._epg_request_timer.timeout.connect(self.send_epg_request)
+        self._volume_timer.timeout.connect(self.send_volume_request)
+        self._fav_append_timer.timeout.connect(self.append_fav_chunk)
         # About.
         self.about_action.triggered.connect(self.on_about)
         # Context menu items.
@@ -270,42 +477,69 @@ class MainWindow(MainUiWindow):
 
     def init_profiles(self):
         self._profiles = self.settings.profiles
-        self.profile_combo_box.setModel(QStringListModel(list(self._profiles)))
+        self.profile_combo_box.model().setStringList(list(self._profiles))
+        self.init_profile_paths(self.profile_combo_box.currentText())
+
+    def init_profile_paths(self, name):
+        """ Caches the current profile and its paths. """
+        self._current_profile = self._profiles.get(name)
+        p_name = self._current_profile["name"] if self._current_profile else name
+        self._data_path = f"{self.settings.data_path}{p_name}{os.sep}"
+        self._picon_path = f"{self.settings.picon_path}{name}{os.sep}"
+        self._backup_path = f"{self.settings.backup_path}{name}{os.sep}"
 
     def init_http_api(self):
         if self._http_api:
             self._update_state_timer.stop()
-
-        callbacks = {HttpAPI.Request.INFO: self.update_state_info,
-                     HttpAPI.Request.SIGNAL: self.update_signal,
-                     HttpAPI.Request.STREAM: self.update_playback,
-                     HttpAPI.Request.TIMER: self.on_timer_done,
-                     HttpAPI.Request.TIMER_LIST: self.update_timer_list,
-                     HttpAPI.Request.EPG: self.update_single_epg,
-                     HttpAPI.Request.GRUB: self.update_screenshot,
-                     HttpAPI.Request.REMOTE: self.on_action_done,
-                     HttpAPI.Request.VOL: self.on_action_done}
-
-        self._http_api = HttpAPI(self._profiles.get(self.profile_combo_box.currentText()), callbacks)
-        self._update_state_timer.start(3000)
+            self._http_api.set_profile(self._current_profile)  # Keeps the network manager.
+        else:
+            callbacks = {HttpAPI.Request.INFO: self.update_state_info,
+                         HttpAPI.Request.SIGNAL: self.update_signal,
+                         HttpAPI.Request.STREAM: self.update_playback,
+                         HttpAPI.Request.TIMER: self.on_timer_done,
+                         HttpAPI.Request.TIMER_LIST: self.update_timer_list,
+                         HttpAPI.Request.EPG: self.update_single_epg,
+                         HttpAPI.Request.GRUB: self.update_screenshot,
+                         HttpAPI.Request.REMOTE: self.on_action_done,
+                         HttpAPI.Request.VOL: self.on_action_done}
+
+            self._http_api = HttpAPI(self._current_profile, callbacks)
+
+        self._state_request_pending = False
+        self._state_interval = self._STATE_INTERVAL
+        self._last_state = None
+        self._epg_cache.clear()
+        self._update_state_timer.start(self._state_interval)
 
     def init_last_config(self):
         """ Initialization of the last configuration. """
         if self.settings.load_last_config:
             config = self.settings.last_config
+            # Will be applied after the data is loaded.
+            self._last_bouquet = config.get("last_bouquet", (-1, -1, -1, -1))
+            current_profile = self.profile_combo_box.currentText()
             self.profile_combo_box.setCurrentText(config.get("last_profile", ""))
-            self.load_data()
-            # Last selected bouquet.
-            last_bouquet = config.get("last_bouquet", (-1, -1, -1, -1))
-            sel_model = self.bouquets_view.selectionModel()
-            root_index = self.bouquets_view.model().index(last_bouquet[0], last_bouquet[1])
-            index = root_index.child(last_bouquet[2], last_bouquet[3])
-            sel_model.select(index, sel_model.ClearAndSelect | sel_model.Rows)
-            sel_model.setCurrentIndex(index, sel_model.NoUpdate)
+            if self.profile_combo_box.currentText() == current_profile:
+                self.load_data()  # Otherwise, the data has already been loaded on the profile change.
+
+    def select_last_bouquet(self):
+        """ Selects the last selected bouquet from the config. """
+        last_bouquet, self._last_bouquet = self._last_bouquet, None
+        if not last_bouquet:
+            return
+
+        sel_model = self.bouquets_view.selectionModel()
+        root_index = self.bouquets_view.model().index(last_bouquet[0], last_bouquet[1])
+        index = root_index.child(last_bouquet[2], last_bouquet[3])
+        sel_model.select(index, sel_model.ClearAndSelect | sel_model.Rows)
+        sel_model.setCurrentIndex(index, sel_model.NoUpdate)
 
     def on_current_page_changed(self, index):
         page = Page(index)
         self.current_page = page
+        self._state_interval = self._STATE_INTERVAL
+        if not self._state_request_pending:
+            self._update_state_timer.start(self._state_interval)
         if page is Page.SAT:
             self.on_satellite_page_show()
         elif page is Page.PICONS:
@@ -316,7 +550,8 @@ class MainWindow(MainUiWindow):
             self.on_ftp_page_show()
 
     def on_profile_changed(self, name):
-        self.settings.current_profile = self._profiles[name]
+        self.init_profile_paths(name)
+        self.settings.current_profile = self._current_profile
         picon_path = self.get_picon_path()
         self.services_view.model().picon_path = picon_path
         self.fav_view.model().picon_path = picon_path
@@ -337,6 +572,18 @@ class MainWindow(MainUiWindow):
         app = Application.instance()
         app.set_locale(locale)
         self.retranslate_ui(self)
+        self.init_srv_info_template()
+
+    def changeEvent(self, event):
+        """ Resumes the state polling when the window is restored from the minimized state. """
+        if event.type() == QEvent.WindowStateChange and event.oldState() & Qt.WindowMinimized:
+            self.resume_state_polling()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        """ Resumes the state polling when the [hidden] window is shown. """
+        super().showEvent(event)
+        self.resume_state_polling()
 
     def closeEvent(self, event):
         """ Main window close event.
@@ -430,21 +677,25 @@ class MainWindow(MainUiWindow):
         self.log_text_browser.append(commands[1])
 
     def on_data_import(self, state):
-        resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()))
+        resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()),
+                                                options=_DIR_DIALOG_OPTIONS)
         QMessageBox.information(self, APP_NAME, self.tr("Not implemented yet!"))
 
     def on_data_open(self, state):
         page = Page(self.stacked_widget.currentIndex())
         if page is Page.BOUQUETS:
-            resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()))
+            resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()),
+                                                    options=_DIR_DIALOG_OPTIONS)
             if resp:
                 self.load_data(resp + os.sep)
         elif page is Page.SAT:
-            resp = QFileDialog.getOpenFileName(self, self.tr("Select file"), str(Path.home()), " satellites.xml")
+            resp = QFileDialog.getOpenFileName(self, self.tr("Select file"), str(Path.home()), " satellites.xml",
+                                               options=_FILE_DIALOG_OPTIONS)
             if resp[0]:
                 self.load_satellites(resp[0])
         elif page is Page.PICONS:
-            resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()))
+            resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()),
+                                                    options=_DIR_DIALOG_OPTIONS)
             if resp:
                 self.load_picons(resp + os.sep)
         else:
@@ -452,7 +703,7 @@ class MainWindow(MainUiWindow):
 
     def on_data_extract(self, state):
         resp = QFileDialog.getOpenFileName(self, self.tr("Select Archive"), str(Path.home()),
-                                           "Archive files (*.gz *.zip)", )
+                                           "Archive files (*.gz *.zip)", options=_FILE_DIALOG_OPTIONS)
         if all(resp):
             self.load_compressed_data(resp[0])
 
@@ -462,131 +713,129 @@ class MainWindow(MainUiWindow):
         backup_dialog.exec()
 
     def get_data_path(self):
-        profile = self._profiles.get(self.profile_combo_box.currentText())
-        return f"{self.settings.data_path}{profile['name']}{os.sep}"
+        return self._data_path
 
     def get_picon_path(self):
-        return f"{self.settings.picon_path}{self.profile_combo_box.currentText()}{os.sep}"
+        return self._picon_path
 
     def get_backup_path(self):
-        return f"{self.settings.backup_path}{self.profile_combo_box.currentText()}{os.sep}"
+        return self._backup_path
 
     def load_data(self, path=None):
+        """ Starts data reading in a separate thread and returns the reader. """
         if not path:
             path = self.get_data_path()
 
-        try:
-            self.clean_data()
-            bouquets = BouquetsReader(path).get()
-            services = LameDbReader(path).parse()
-        except FileNotFoundError as e:
-            msg = self.tr("Please, download files from receiver or setup your path for read data!")
-            self.show_error_dialog(msg)
-            log(e)
-        else:
-            self.append_data(bouquets, services)
+        if self._data_reader and self._data_reader.isRunning():
+            # Discarding the results of the previous reading.
+            self._data_reader.loaded.disconnect()
+            self._data_reader.error_message.disconnect()
+
+        self.clean_data()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._data_reader = DataReader(path, parent=self)
+        self._data_reader.loaded.connect(self.append_data)
+        self._data_reader.error_message.connect(self.on_data_read_error)
+        self._data_reader.finished.connect(QApplication.restoreOverrideCursor)
+        self._data_reader.start()
+
+        return self._data_reader
+
+    def on_data_read_error(self, msg):
+        self.show_error_dialog(self.tr("Please, download files from receiver or setup your path for read data!"))
 
     def load_compressed_data(self, data_path):
         """ Opening archived data.  """
-        arch_path = self.get_archive_path(data_path)
-        if arch_path:
-            if self.current_page is Page.BOUQUETS:
-                self.load_data(arch_path.name + os.sep)
-            elif self.current_page is Page.SAT:
-                s_path = arch_path.name + os.sep + "satellites.xml"
-                if os.path.exists(s_path):
-                    self.load_satellites(s_path)
-                else:
-                    self.show_error_dialog(self.tr("File not found!"))
-
-            arch_path.cleanup()
-
-    def get_archive_path(self, data_path):
-        """ Returns the temp dir path for the extracted data, or None if the archive format is not supported. """
-        import zipfile
-        import tarfile
-        import tempfile
-
-        tmp_path = tempfile.TemporaryDirectory()
-        tmp_path_name = tmp_path.name
+        extractor = ArchiveExtractor(data_path, parent=self)
+        extractor.extracted.connect(self.on_archive_extracted)
+        extractor.error_message.connect(self.show_error_dialog)
+        extractor.start()
 
-        if zipfile.is_zipfile(data_path):
-            with zipfile.ZipFile(data_path) as zip_file:
-                for zip_info in zip_file.infolist():
-                    if not zip_info.filename.endswith(os.sep):
-                        zip_info.filename = os.path.basename(zip_info.filename)
-                        zip_file.extract(zip_info, path=tmp_path_name)
-        elif tarfile.is_tarfile(data_path):
-            with tarfile.open(data_path) as tar:
-                for mb in tar.getmembers():
-                    if mb.isfile():
-                        mb.name = os.path.basename(mb.name)
-                        tar.extract(mb, path=tmp_path_name)
-        else:
-            tmp_path.cleanup()
-            log("Error getting the path for the archive. Unsupported file format: {}".format(data_path))
-            self.show_error_dialog(self.tr("Unsupported format!"))
+    def on_archive_extracted(self, arch_path):
+        """ Loads data from the temp dir of the extracted archive. """
+        if self.current_page is Page.BOUQUETS:
+            # Temp dir should only be removed after the reading is finished.
+            self.load_data(arch_path.name + os.sep).finished.connect(arch_path.cleanup)
             return
+        elif self.current_page is Page.SAT:
+            s_path = arch_path.name + os.sep + "satellites.xml"
+            if os.path.exists(s_path):
+                self.load_satellites(s_path).finished.connect(arch_path.cleanup)
+                return
+            self.show_error_dialog(self.tr("File not found!"))
 
-        return tmp_path
+        arch_path.cleanup()
 
     def append_data(self, bouquets, services):
         self.append_bouquets(bouquets)
         self.append_services(services)
+        if self._last_bouquet:
+            # After the views have processed the new data.
+            QTimer.singleShot(0, self.select_last_bouquet)
 
     def append_services(self, services):
-        model = self.services_view.model()
         for s in services:
             self._services[s.fav_id] = s
-            model.appendRow(QStandardItem(i) for i in s)
-
-        self.update_services_count(services)
+        self.services_view.model().appendRows(services)
+        self._services_counter.update(map(attrgetter("service_type"), services))
+        self.update_services_count()
 
     def append_bouquets(self, bouquets):
         model = self.bouquets_view.model()
         root_node = model.invisibleRootItem()
         for i, bqs in enumerate(bouquets):
-            root = QStandardItem(QIcon.fromTheme("tv-symbolic" if i == 0 else "radio-symbolic"), bqs.name)
+            root = QStandardItem(self._tv_icon if i == 0 else self._radio_icon, bqs.name)
             root.setDragEnabled(False)
-            for bq in bqs.bouquets:
-                self.append_bouquet(bq, root)
+            root.setRowCount(len(bqs.bouquets))
+            for r, bq in enumerate(bqs.bouquets):
+                self.append_bouquet(bq, root, r)
             root_node.appendRow(root)
         self.bouquets_count_label.setText(str(len(self._bouquets)))
 
-    def append_bouquet(self, bq, parent):
+    def append_bouquet(self, bq, parent, row=None):
+        """ Appends bouquet to the parent item or sets it to the given [preallocated] row. """
         name, bq_type, locked, hidden = bq.name, bq.type, bq.locked, bq.hidden
-        row = (QStandardItem(bq.name), QStandardItem(locked), QStandardItem(hidden), QStandardItem(bq_type))
-        parent.appendRow(row)
-        bq_id = f"{name}:{bq_type}"
+        items = (QStandardItem(bq.name), QStandardItem(locked), QStandardItem(hidden), QStandardItem(bq_type))
+        if row is None:
+            parent.appendRow(items)
+        else:
+            for c, item in enumerate(items):
+                parent.setChild(row, c, item)
+        bq_id = (name, bq_type)
         services = []
         extra_services = {}  # for services with different names in bouquet and main list
-        agr = [None] * 7
+        agr = (None,) * 7  # Shared, immutable filler for the unused fields.
+        # Local names for the loop.
+        iptv_type, alt_type, sub_type = BqServiceType.IPTV, BqServiceType.ALT, BqServiceType.BOUQUET
+        extra_types = {BqServiceType.MARKER, iptv_type, BqServiceType.SPACE}
+        all_services, blacklist = self._services, self._blacklist
+
         for srv in bq.services:
             fav_id = srv.data
             # IPTV and MARKER services
             s_type = srv.type
-            if s_type in (BqServiceType.MARKER, BqServiceType.IPTV, BqServiceType.SPACE):
+            if s_type in extra_types:
                 icon = None
                 picon_id = None
                 data_id = str(srv.num)
                 locked = None
 
-                if s_type is BqServiceType.IPTV:
+                if s_type is iptv_type:
                     icon = IPTV_ICON
-                    fav_id_data = fav_id.lstrip().split(":")
+                    fav_id_data = fav_id.lstrip().split(":", 11)  # Only the reference part is needed.
                     if len(fav_id_data) > 10:
                         data_id = ":".join(fav_id_data[:11])
-                        picon_id = "{}_{}_{}_{}_{}_{}_{}_{}_{}_{}.png".format(*fav_id_data[:10])
-                        locked = LOCKED_ICON if data_id in self._blacklist else None
+                        picon_id = f"{'_'.join(fav_id_data[:10])}.png"
+                        locked = LOCKED_ICON if data_id in blacklist else None
                 srv = Service(None, None, icon, None, picon_id, srv.name, locked, None,
                               None, s_type.name, *agr, data_id, fav_id, None)
-                self._services[fav_id] = srv
-            elif s_type is BqServiceType.ALT:
+                all_services[fav_id] = srv
+            elif s_type is alt_type:
                 self._alt_file.add(f"{srv.data}:{bq_type}")
                 srv = Service(None, None, None, None, None, srv.name, locked, None, None, s_type.name,
                               *agr, srv.data, fav_id, srv.num)
-                self._services[fav_id] = srv
-            elif s_type is BqServiceType.BOUQUET:
+                all_services[fav_id] = srv
+            elif s_type is sub_type:
                 # Sub bouquets!
                 log(f"Detected sub-bouquet: [{srv.name}]! This feature is not supported yet!")
             elif srv.name:
@@ -604,33 +853,66 @@ class MainWindow(MainUiWindow):
         ex_services = self._extra_bouquets.get(bq_selected, None)
         self.fav_count_label.setText(str(len(services)))
 
-        self.fav_view.clear_data()
-        model = self.fav_view.model()
+        srvs = []
+        get_service = self._services.get
+        alt_type = BqServiceType.ALT.name
 
         for srv_id in services:
-            srv = self._services.get(srv_id, None)
-            ex_srv_name = None
-            if ex_services:
-                ex_srv_name = ex_services.get(srv_id)
-            if srv:
-                # Alternatives
-                if srv.service_type == BqServiceType.ALT.name:
-                    alt_servs = srv.transponder
-                    if alt_servs:
-                        alt_srv = self._services.get(alt_servs[0].data, None)
-                        srv = srv._replace(transponder=None)
-
-                srv = srv._replace(name=ex_srv_name) if ex_srv_name else srv
-                model.appendRow((QStandardItem(i) for i in srv))
+            srv = get_service(srv_id, None)
+            if not srv:
+                continue
+            # Alternatives
+            if srv.service_type == alt_type and srv.transponder:
+                srv = srv._replace(transponder=None)
+            # Extra names.
+            ex_srv_name = ex_services.get(srv_id) if ex_services else None
+            if ex_srv_name:
+                srv = srv._replace(name=ex_srv_name)
+            srvs.append(srv)
+
+        self._fav_append_timer.stop()
+        self._fav_pending = []
+        if len(srvs) > self._FAV_CHUNK_THRESHOLD:
+            # The first rows are shown immediately, the rest are appended by the timer.
+            self._fav_pending = srvs[self._FAV_CHUNK_SIZE:]
+            srvs = srvs[:self._FAV_CHUNK_SIZE]
+            self._fav_append_timer.start()
+
+        item = QStandardItem
+        self.fav_view.model().reset_rows([[item(i) for i in srv] for srv in srvs])
+
+    def append_fav_chunk(self, all_pending=False):
+        """ Appends the next chunk [or all] of the pending services to the FAV view. """
+        size = len(self._fav_pending) if all_pending else self._FAV_CHUNK_SIZE
+        chunk, self._fav_pending = self._fav_pending[:size], self._fav_pending[size:]
+        item = QStandardItem
+        self.fav_view.model().extend_rows([[item(i) for i in srv] for srv in chunk])
+
+        if self._fav_pending:
+            self._fav_append_timer.start()
+
+    def finish_fav_loading(self):
+        """ Appends all pending services. Must be called before the FAV model is read or changed. """
+        if self._fav_pending:
+            self._fav_append_timer.stop()
+            self.append_fav_chunk(True)
 
     def clean_data(self):
         self.bouquets_view.clear_data()
-        self.services_view.clear_data()
+        self.services_view.model().reset_rows()
+        self._fav_append_timer.stop()
+        self._fav_pending.clear()
         self.fav_view.clear_data()
         self.service_filter_edit.setText("")
 
-        for c in (self._bouquets, self._bq_file, self._extra_bouquets, self._services, self._blacklist, self._alt_file):
-            c.clear()
+        self._bouquets.clear()
+        self._bq_file.clear()
+        self._extra_bouquets.clear()
+        self._services.clear()
+        self._services_counter.clear()
+        self._srv_info_cache.clear()
+        self._blacklist.clear()
+        self._alt_file.clear()
 
     # ********************* Data save. ********************* #
 
@@ -649,7 +931,8 @@ class MainWindow(MainUiWindow):
             QMessageBox.information(self, APP_NAME, self.tr("Not implemented yet!"))
 
     def on_data_save_as(self):
-        resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()))
+        resp = QFileDialog.getExistingDirectory(self, self.tr("Select Directory"), str(Path.home()),
+                                                options=_DIR_DIALOG_OPTIONS)
         if not resp:
             return
 
@@ -686,10 +969,7 @@ class MainWindow(MainUiWindow):
         BouquetsWriter(path, bouquets).write()
 
         # Processing services.
-        model = self.services_view.model()
-        c_count = model.columnCount()
-        services = (Service(*(model.index(r, c).data() for c in range(c_count))) for r in range(model.rowCount()))
-        LameDbWriter(path, services).write()
+        LameDbWriter(path, iter(self.services_view.model().services)).write()
         # Blacklist.
         write_blacklist(path, self._blacklist)
 
@@ -714,8 +994,10 @@ class MainWindow(MainUiWindow):
             return
 
         resp = QFileDialog.getOpenFileName(self, self.tr("Select *.m3u file"), str(Path.home()),
-                                           "Playlist files (*.m3u *.m3u8)", )
+                                           "Playlist files (*.m3u *.m3u8)", options=_FILE_DIALOG_OPTIONS)
         if all(resp):
+            from app.streams.iptv import import_m3u
+
             services = import_m3u(resp[0])
             self.append_imported_services(services)
 
@@ -734,17 +1016,18 @@ class MainWindow(MainUiWindow):
 
         service_dialog = IptvServiceDialog()
         if service_dialog.exec():
+            self.finish_fav_loading()
             row = self.fav_view.currentIndex().row()
             service = service_dialog.service
             model = self.fav_view.model()
             bq = self._bouquets.get(self._bq_selected, None)
             if row < 0:
-                model.appendRow(QStandardItem(i) for i in service)
+                model.appendRow([QStandardItem(i) for i in service])
                 self.fav_view.scrollToBottom()
                 self.fav_view.selectRow(model.rowCount() - 1)
                 bq.append(service.fav_id)
             else:
-                model.insertRow(row + 1, (QStandardItem(i) for i in service))
+                model.insertRow(row + 1, [QStandardItem(i) for i in service])
                 bq.insert(row + 1, service.fav_id)
             self._services[service.fav_id] = service
 
@@ -771,7 +1054,7 @@ class MainWindow(MainUiWindow):
 
         name = dialog.textValue()
         # Checking if the given name is already present.
-        if self._bouquets.keys() & {f"{name}:{BqType.TV.value}", f"{name}:{BqType.RADIO.value}"}:
+        if self._bouquets.keys() & {(name, BqType.TV.value), (name, BqType.RADIO.value)}:
             self.show_error_dialog(self.tr("A bouquet with that name exists!"))
             return
 
@@ -786,49 +1069,66 @@ class MainWindow(MainUiWindow):
         bq = (QStandardItem(name), None, None, QStandardItem(b_type))
         row = 0 if parent_row < 0 else cur_index.row() + 1
         root_item.insertRow(row, bq)
-        self._bouquets[f"{name}:{b_type}"] = []
+        self._bouquets[(name, b_type)] = []
         self.bouquets_count_label.setText(str(len(self._bouquets)))
 
     def on_bouquet_selection(self, selected_item, deselected_item):
         indexes = selected_item.indexes()
         if len(indexes) > 1:
-            self._bq_selected = f"{indexes[Column.BQ_NAME].data()}:{indexes[Column.BQ_TYPE].data()}"
-            self.update_bouquet_services(self._bq_selected)
+            bq_selected = (indexes[Column.BQ_NAME].data(), indexes[Column.BQ_TYPE].data())
+            if bq_selected == self._bq_selected and self.fav_view.model().rowCount():
+                return  # Already shown.
+
+            self._bq_selected = bq_selected
+            self.update_bouquet_services(bq_selected)
 
     def on_fav_selection(self, selected_item, deselected_item):
         if self.current_page is Page.EPG and self._http_api:
             ind = selected_item.indexes()
 
             if len(ind) == self.fav_view.model().columnCount():
-                ref = self.get_service_ref(ind[Column.FAV_ID].data(), ind[Column.TYPE].data())
-                self._http_api.send(self._http_api.Request.EPG, ref)
-                self.fav_view.setEnabled(False)
+                self._epg_ref = self.get_service_ref(ind[Column.FAV_ID].data(), ind[Column.TYPE].data())
+                self._epg_request_timer.start()
+
+    def send_epg_request(self):
+        """ Sends the EPG request for the last selected service. """
+        if self._epg_ref and self._http_api:
+            cached = self._epg_cache.get(self._epg_ref)
+            if cached and time.monotonic() - cached[0] < self._EPG_CACHE_TTL:
+                self._epg_cache.move_to_end(self._epg_ref)
+                self.append_epg_events(cached[1])
+                return
+
+            self._http_api.send(self._http_api.Request.EPG, self._epg_ref)
+            self.fav_view.setEnabled(False)
 
     def on_fav_data_changed(self):
         """  Refreshes the current bouquet services list.
 
             Called when the data in the favorites model has changed [insert, move, etc.].
         """
+        self.finish_fav_loading()
         bq = self._bouquets.get(self._bq_selected, None)
         if bq is None:
             self.fav_view.clear_data()
             self.show_error_dialog(self.tr("No bouquet is selected!"))
             return
 
-        bq.clear()
         model = self.fav_view.model()
-        for r in range(model.rowCount()):
-            bq.append(model.index(r, Column.FAV_ID).data())
+        index, fav_id_column = model.index, Column.FAV_ID
+        bq[:] = [index(r, fav_id_column).data() for r in range(model.rowCount())]
         self.fav_count_label.setText(str(len(bq)))
 
     def on_locate_service(self, fav_id):
         model = self.services_view.model()
-        for r in range(model.rowCount()):
-            index = model.index(r, Column.FAV_ID)
-            if fav_id == index.data():
-                sel_model = self.services_view.selectionModel()
-                sel_model.select(index, sel_model.ClearAndSelect | sel_model.Rows)
-                self.services_view.scrollTo(model.index(r, Column.NAME))
+        # Search in the source rows. Mapping to the view [sorted, filtered] only for the found one.
+        for r, srv in enumerate(model.services):
+            if srv.fav_id == fav_id:
+                index = model.mapFromSource(model.sourceModel().index(r, Column.NAME))
+                if index.isValid():
+                    sel_model = self.services_view.selectionModel()
+                    sel_model.select(index, sel_model.ClearAndSelect | sel_model.Rows)
+                    self.services_view.scrollTo(index)
                 break
 
     def insert_marker(self):
@@ -847,7 +1147,7 @@ class MainWindow(MainUiWindow):
 
         marker = Service(*[None] * 5, txt, None, None, None, m_type.name, *[None] * 8, fav_id, None)
         model = self.fav_view.model()
-        row = (QStandardItem(d) for d in marker)
+        row = [QStandardItem(d) for d in marker]
         target = self.fav_view.selectionModel().currentIndex()
         model.insertRow(target.row() + 1, row)
         self.fav_view.inserted.emit(True)
@@ -857,53 +1157,73 @@ class MainWindow(MainUiWindow):
         service = self._services.get(model.index(row, Column.FAV_ID).data(), None)
         if service:
             s_type = service.service_type
-            if s_type in self._marker_types:
+            if s_type in _MARKER_TYPES:
                 return
 
             dialog = IptvServiceDialog(service) if s_type == BqServiceType.IPTV.value else ServiceDialog(service)
             if dialog.exec():
                 self._services.pop(service.fav_id, None)
+                if model is self.services_view.model():
+                    self._services_counter[service.service_type] -= 1
+                    self._services_counter[dialog.service.service_type] += 1
+                    self.update_services_count()
                 service = dialog.service
                 self._services[service.fav_id] = service
                 [model.setData(model.index(row, c), d) for c, d in enumerate(service)]
 
     def remove_services(self, rows):
-        list(map(lambda s: self._services.pop(s, None), rows.values()))
-        # Fav model update.
+        self.finish_fav_loading()
         ids = set(rows.values())
+        counter = self._services_counter
+        for fav_id in ids:
+            srv = self._services.pop(fav_id, None)
+            if srv:
+                counter[srv.service_type] -= 1
+        # Fav model update. Rows selection to delete.
         model = self.fav_view.model()
+        selection = QItemSelection()
+        index, fav_id_column = model.index, Column.FAV_ID
+        for r in range(model.rowCount()):
+            if index(r, fav_id_column).data() in ids:
+                first = index(r, 0)
+                selection.select(first, first)
         sel_model = self.fav_view.selectionModel()
-        for k, v in {model.index(r, 0): model.index(r, Column.FAV_ID).data() for r in range(model.rowCount())}.items():
-            if v in ids:
-                # Rows selection to delete.
-                sel_model.select(k, sel_model.Select | sel_model.Rows)
+        sel_model.select(selection, sel_model.Select | sel_model.Rows)
         self.fav_view.on_remove()
 
     def on_service_remove_done(self):
-        self.update_services_count(filter(lambda s: s.pos, self._services.values()))
+        self.update_services_count()
 
     def remove_favorites(self, rows):
         bq = self._bouquets.get(self._bq_selected, None)
         if bq:
-            list(map(bq.pop, rows))
+            for r in rows:
+                bq.pop(r)
             self.fav_count_label.setText(str(len(bq)))
 
     def remove_bouquets(self, rows):
-        bqs = {f"{r[Column.BQ_NAME].data()}:{r[Column.BQ_TYPE].data()}" for r in rows}
-        list(map(self._bouquets.pop, bqs))
-        self.fav_view.clear_data() if self._bq_selected in bqs else None
+        bqs = {(r[Column.BQ_NAME].data(), r[Column.BQ_TYPE].data()) for r in rows}
+        for bq_id in bqs:
+            self._bouquets.pop(bq_id)
+        if self._bq_selected in bqs:
+            self._fav_append_timer.stop()
+            self._fav_pending.clear()
+            self.fav_view.clear_data()
         self.bouquets_count_label.setText(str(len(self._bouquets)))
 
-    def update_services_count(self, services):
+    def update_services_count(self):
         """ Updates service counters. """
-        counter = Counter(s.service_type for s in services)
-        self.data_count_label.setText(str(counter.get("Data", 0)))
-        self.radio_count_label.setText(str(counter.get("Radio", 0)))
-        self.tv_count_label.setText(str(sum(v for k, v in counter.items() if k not in {"Data", "Radio"})))
+        counter = self._services_counter
+        data, radio = counter["Data"], counter["Radio"]
+        tv = sum(counter.values()) - data - radio
+
+        self.data_count_label.setText(str(data))
+        self.radio_count_label.setText(str(radio))
+        self.tv_count_label.setText(str(tv))
 
     def get_bouquet(self, bq_name, locked, hidden, bq_type):
         """ Constructs and returns Bouquet class instance. """
-        bq_id = f"{bq_name}:{bq_type}"
+        bq_id = (bq_name, bq_type)
         ext_services = self._extra_bouquets.get(bq_id, None)
         bq_s = list(filter(None, [self._services.get(f_id, None) for f_id in self._bouquets.get(bq_id, [])]))
         bq_s = self.get_bq_services(bq_s, ext_services)
@@ -916,8 +1236,8 @@ class MainWindow(MainUiWindow):
         for srv in services:
             if srv.service_type == BqServiceType.ALT.name:
                 # Alternatives to service in a bouquet.
-                alts = list(map(lambda s: s._replace(name=None),
-                                filter(None, [self._services.get(s.data, None) for s in srv.transponder or []])))
+                alts = [self._services[s.data]._replace(name=None) for s in srv.transponder or []
+                        if s.data in self._services]
                 s_list.append(srv._replace(transponder=alts))
             else:
                 # Extra names for service in bouquet.
@@ -929,12 +1249,14 @@ class MainWindow(MainUiWindow):
         self.copy_to(self.services_view, self.fav_view, self.fav_view.model().index(-1, 0))
 
     def on_to_fav_end_copy(self):
+        self.finish_fav_loading()
         self.fav_view.scrollToBottom()
         model = self.fav_view.model()
         self.copy_to(self.services_view, self.fav_view, model.index(model.rowCount() - 1, 0))
 
     def copy_to(self, src_view, dst_view, index):
         if self._bq_selected in self._bouquets:
+            self.finish_fav_loading()
             dst_view.setCurrentIndex(index)
             src_view.on_copy()
             dst_view.on_paste()
@@ -962,7 +1284,7 @@ class MainWindow(MainUiWindow):
 
         model = self.services_view.model()
         values = {model.index(i, column).data() for i in range(model.rowCount())}
-        exist = {k.rstrip(":tv").rstrip(":radio") for k in self._bouquets.keys()} & values
+        exist = {k[0] for k in self._bouquets} & values
         # Splitting services by column value.
         d = defaultdict(list)
         [d[model.index(r, column).data()].append(
@@ -988,24 +1310,26 @@ class MainWindow(MainUiWindow):
             self.load_satellites(f"{self.get_data_path()}satellites.xml")
 
     def load_satellites(self, path):
-        self.satellite_view.clear_data()
-        try:
-            satellites = get_satellites(path)
-        except FileNotFoundError as e:
-            log(e)
-        else:
-            model = self.satellite_view.model()
-            [model.appendRow((self.get_satellite_row(sat))) for sat in satellites]
-            self.satellite_count_label.setText(str(model.rowCount()))
+        """ Starts satellites reading in a separate thread and returns the reader. """
+        if self._sat_reader and self._sat_reader.isRunning():
+            # Discarding the results of the previous reading.
+            self._sat_reader.loaded.disconnect()
 
-    def on_satellite_selection(self, selected, deselected):
-        self.transponder_view.clear_data()
+        self._sat_reader = SatellitesReader(path, parent=self)
+        self._sat_reader.loaded.connect(self.append_satellites)
+        self._sat_reader.start()
 
+        return self._sat_reader
+
+    def append_satellites(self, satellites):
+        model = self.satellite_view.model()
+        model.reset_rows([self.get_satellite_row(sat) for sat in satellites])
+        self.satellite_count_label.setText(str(model.rowCount()))
+
+    def on_satellite_selection(self, selected, deselected):
         t_model = self.transponder_view.model()
         sat = self.satellite_view.model().index(selected.row(), Column.SAT_DATA).data(Qt.UserRole)
-        if sat:
-            for t in sat.transponders:
-                t_model.appendRow(QStandardItem(i) for i in t)
+        t_model.reset_rows([[QStandardItem(i) for i in t] for t in sat.transponders] if sat else ())
 
         self.satellite_transponder_count_label.setText(str(t_model.rowCount()))
 
@@ -1069,7 +1393,7 @@ class MainWindow(MainUiWindow):
             t_model = self.transponder_view.model()
             if is_add:
                 sat.transponders.append(transponder)
-                t_model.appendRow(QStandardItem(i) for i in transponder)
+                t_model.appendRow([QStandardItem(i) for i in transponder])
                 self.satellite_transponder_count_label.setText(str(t_model.rowCount()))
             else:
                 sat.transponders[row] = transponder
@@ -1085,7 +1409,8 @@ class MainWindow(MainUiWindow):
         data_index = model.index(self.satellite_view.currentIndex().row(), Column.SAT_DATA)
         sat = data_index.data(Qt.UserRole)
         if sat:
-            list(map(sat.transponders.pop, rows))
+            for r in rows:
+                sat.transponders.pop(r)
             model.setData(data_index, sat, Qt.UserRole)
             self.satellite_transponder_count_label.setText(str(len(sat.transponders)))
 
@@ -1161,20 +1486,44 @@ class MainWindow(MainUiWindow):
             @param model: model to add data.
             @param ids: service ids.
         """
-        for f in path.glob("*.png"):
-            info = self.get_service_info(self._services.get(ids.get(f.name, None), None))
-            model.appendRow((QStandardItem(info if info else f.name), QStandardItem(str(f)), None))
+        scanner = self._picon_scanners.get(model, None)
+        if scanner and scanner.isRunning():
+            # Discarding the results of the previous listing.
+            scanner.loaded.disconnect()
+
+        scanner = PiconScanner(path, parent=self)
+        scanner.loaded.connect(lambda files: self.on_picons_scanned(files, model, ids))
+        self._picon_scanners[model] = scanner
+        scanner.start()
+
+    def on_picons_scanned(self, files, model, ids):
+        """ Appends the listed picon files to the given model. """
+        get_service, get_info, item = self._services.get, self.get_service_info, QStandardItem
+        rows = []
+        for name, f_path in files:
+            srv = get_service(ids.get(name, None), None)
+            rows.append((item(get_info(srv) if srv else name), item(f_path), None))
+        model.appendRows(rows)
 
     def get_service_info(self, srv):
         """ Returns info string representation about the service. """
         if not srv:
             return ""
 
-        header = "{}: {}\n{}: {}\n{}: {}\n".format(self.tr("Name"), srv.name,
-                                                   self.tr("Type"), srv.service_type,
-                                                   self.tr("Package"), srv.package)
-        ref = f"{self.tr('Service reference')}: {srv.picon_id.rstrip('.png')}"
-        return f"{header}\n{ref}"
+        cached = self._srv_info_cache.get(srv.fav_id)
+        if cached and cached[0] is srv:
+            return cached[1]
+
+        ref = srv.picon_id[:-4] if srv.picon_id.endswith(".png") else srv.picon_id
+        info = self._srv_info_tmp.format(name=srv.name, s_type=srv.service_type, package=srv.package, ref=ref)
+        self._srv_info_cache[srv.fav_id] = (srv, info)
+        return info
+
+    def init_srv_info_template(self):
+        """ Builds the translated template for the service info. """
+        name, s_type, package, ref = self.tr("Name"), self.tr("Type"), self.tr("Package"), self.tr("Service reference")
+        self._srv_info_tmp = f"{name}: {{name}}\n{s_type}: {{s_type}}\n{package}: {{package}}\n\n{ref}: {{ref}}"
+        self._srv_info_cache.clear()
 
     def selected_dst_picons(self):
         """ Returns a set of selected picon files from the dst view. """
@@ -1182,7 +1531,8 @@ class MainWindow(MainUiWindow):
 
     def on_picon_remove(self, rows):
         paths = (self.picon_dst_view.model().index(r, Column.PICON_PATH).data() for r in rows)
-        list(map(lambda p: QFile(p).remove(), paths))
+        for p in paths:
+            QFile(p).remove()
 
     def on_picon_remove_from_receiver(self, rows):
         paths = {Path(self.picon_dst_view.model().index(r, Column.PICON_PATH).data()).name for r in rows}
@@ -1194,6 +1544,12 @@ class MainWindow(MainUiWindow):
 
     # ******************** Streams ********************* #
 
+    def preload_player(self):
+        """ Starts preloading of the player libraries to speed up the first playback. """
+        if not self._player:
+            self._player_loader = PlayerLoader(self.settings.stream_lib, self)
+            self._player_loader.start()
+
     def playback_start(self, event=None):
         self.streams_tool_button.toggle()
 
@@ -1210,7 +1566,7 @@ class MainWindow(MainUiWindow):
                 return
 
         indexes = self.fav_view.selectionModel().selectedIndexes()
-        if not indexes or indexes[Column.TYPE].data() in self._marker_types or not self._http_api:
+        if not indexes or indexes[Column.TYPE].data() in _MARKER_TYPES or not self._http_api:
             return
 
         ref = self.get_service_ref(indexes[Column.FAV_ID].data(), indexes[Column.TYPE].data())
@@ -1220,7 +1576,9 @@ class MainWindow(MainUiWindow):
         """ Updates current URL for playback. """
         m3u = data.get("m3u", None)
         if m3u:
-            self._player.play([s for s in str(m3u, "utf-8").split("\n") if not s.startswith("#")][0])
+            url = next((s for s in bytes(m3u).splitlines() if s and not s.startswith(b"#")), None)
+            if url:
+                self._player.play(url.decode("utf-8"))
 
     def playback_stop(self):
         if self._player:
@@ -1230,6 +1588,8 @@ class MainWindow(MainUiWindow):
         """ Сontrols the full screen mode for playback. """
         # It looks a bit tricky but works.
         is_full = self.isFullScreen()
+        # Suppresses repainting until all widgets are switched.
+        self.setUpdatesEnabled(False)
         self.header_widget.setVisible(is_full)
         self.media_control_widget.setVisible(is_full)
         self.menuBar().setVisible(is_full)
@@ -1240,38 +1600,53 @@ class MainWindow(MainUiWindow):
         margin_value = 6 if is_full else 0
         self.media_layout.setContentsMargins(margin_value, margin_value, margin_value, margin_value)
         self.central_layout.setContentsMargins(margin_value, margin_value, margin_value, margin_value)
+        self.setUpdatesEnabled(True)
 
         self.showNormal() if is_full else self.showFullScreen()
 
     def update_audio_tracks(self, tracks):
-        self.audio_track_menu.clear()
         current_track = self._player.get_audio_track()
-        group = QActionGroup(self.audio_track_menu)
-        for t in tracks:
-            action = QAction(t[1], self.audio_track_menu)
-            action.setCheckable(True)
-            track = t[0]
-            action.setData(track)
-            action.setChecked(current_track == track)
-            self.audio_track_menu.addAction(action)
-            group.addAction(action)
+        tracks = tuple((t[0], t[1]) for t in tracks)
+        if tracks == self._audio_tracks:
+            for action in self.audio_track_menu.actions():
+                action.setChecked(action.data() == current_track)
+            return
 
+        self._audio_tracks = tracks
+        group = self.init_track_menu(self.audio_track_menu, tracks)
+        for action in group.actions():
+            action.setChecked(action.data() == current_track)
         group.triggered.connect(self.set_audio_track)
 
     def update_subtitle_tracks(self, tracks):
-        self.subtitle_track_menu.clear()
-        group = QActionGroup(self.subtitle_track_menu)
-        for t in tracks:
-            action = QAction(t[1], self.subtitle_track_menu)
-            action.setCheckable(True)
-            action.setData(t[0])
-            self.subtitle_track_menu.addAction(action)
-            group.addAction(action)
+        tracks = tuple((t[0], t[1]) for t in tracks)
+        if tracks == self._subtitle_tracks:
+            return
 
+        self._subtitle_tracks = tracks
+        group = self.init_track_menu(self.subtitle_track_menu, tracks)
         if group.actions():
             group.actions()[0].setChecked(True)
             group.triggered.connect(self.set_subtitle_track)
 
+    def init_track_menu(self, menu, tracks):
+        """ Fills the menu with checkable actions for the tracks [(id, description)]. Returns the action group. """
+        menu.clear()
+        for g in menu.findChildren(QActionGroup):
+            g.deleteLater()
+
+        group = QActionGroup(menu)
+        actions = []
+        for track, desc in tracks:
+            action = QAction(desc, menu)
+            action.setCheckable(True)
+            action.setData(track)
+            group.addAction(action)
+            actions.append(action)
+        menu.addActions(actions)
+
+        return group
+
     def set_audio_track(self, action):
         self._player.set_audio_track(action.data())
 
@@ -1284,9 +1659,17 @@ class MainWindow(MainUiWindow):
     # ********************** EPG *********************** #
 
     def update_single_epg(self, epg):
-        self.epg_view.clear_data()
+        if self._epg_ref and not epg.get("error", None):
+            self._epg_cache[self._epg_ref] = (time.monotonic(), epg)
+            self._epg_cache.move_to_end(self._epg_ref)
+            if len(self._epg_cache) > self._EPG_CACHE_SIZE:
+                self._epg_cache.popitem(last=False)
+
+        self.append_epg_events(epg)
+
+    def append_epg_events(self, epg):
         model = self.epg_view.model()
-        [model.appendRow(self.get_epg_row(event)) for event in epg.get("event_list", [])]
+        model.reset_rows([self.get_epg_row(event) for event in epg.get("event_list", [])])
         self.fav_view.setEnabled(True)
 
     def update_multiple_epg(self, epg):
@@ -1298,16 +1681,15 @@ class MainWindow(MainUiWindow):
             if srv_type == BqServiceType.IPTV.name:
                 return srv.fav_id.strip()
             elif srv.picon_id:
-                return srv.picon_id.rstrip(".png").replace("_", ":")
+                p_id = srv.picon_id
+                return (p_id[:-4] if p_id.endswith(".png") else p_id).replace("_", ":")
 
     def get_epg_row(self, event):
         """ Returns EPG row representation as a tuple. """
         title = event.get("e2eventtitle", "")
         desc = event.get("e2eventdescription", "")
         start = int(event.get("e2eventstart", "0"))
-        start_time = datetime.fromtimestamp(start)
-        end_time = datetime.fromtimestamp(start + int(event.get("e2eventduration", "0")))
-        time_header = f"{start_time.strftime('%A, %H:%M')} - {end_time.strftime('%H:%M')}"
+        time_header = _get_time_header(start, start + int(event.get("e2eventduration", "0")))
         data_item = QStandardItem("Event")
         data_item.setData(event, Qt.UserRole)
 
@@ -1319,9 +1701,8 @@ class MainWindow(MainUiWindow):
         self._http_api.send(HttpAPI.Request.TIMER_LIST)
 
     def update_timer_list(self, timer_list):
-        self.timer_view.clear_data()
         model = self.timer_view.model()
-        [model.appendRow(self.get_timer_row(timer)) for timer in timer_list.get("timer_list", [])]
+        model.reset_rows([self.get_timer_row(timer) for timer in timer_list.get("timer_list", [])])
 
     def on_timer_add(self, state):
         rows = self.fav_view.selectionModel().selectedRows()
@@ -1330,8 +1711,10 @@ class MainWindow(MainUiWindow):
         if row_count == 1:
             row = rows[0].row()
             model = self.fav_view.model()
+            p_id = model.index(row, Column.PICON_ID).data()
+            p_id = p_id[:-4] if p_id.endswith(".png") else p_id
             t_data = {"e2servicename": model.index(row, Column.NAME).data(),
-                      "e2servicereference": model.index(row, Column.PICON_ID).data().rstrip(".png").replace("_", ":")}
+                      "e2servicereference": p_id.replace("_", ":")}
             timer_dialog = TimerDialog(t_data, TimerDialog.TimerAction.ADD)
             if timer_dialog.exec():
                 self._http_api.send(HttpAPI.Request.TIMER, timer_dialog.request)
@@ -1378,9 +1761,7 @@ class MainWindow(MainUiWindow):
         desc = timer.get("e2description", "") or ""
         srv_name = timer.get("e2servicename", "") or ""
 
-        start_time = datetime.fromtimestamp(int(timer.get("e2timebegin", "0")))
-        end_time = datetime.fromtimestamp(int(timer.get("e2timeend", "0")))
-        time_str = f"{start_time.strftime('%A, %H:%M')} - {end_time.strftime('%H:%M')}"
+        time_str = _get_time_header(int(timer.get("e2timebegin", "0")), int(timer.get("e2timeend", "0")))
 
         data_item = QStandardItem("data")
         data_item.setData(timer, Qt.UserRole)
@@ -1394,7 +1775,7 @@ class MainWindow(MainUiWindow):
             if self._ftp:
                 self._ftp.close()
 
-            st = self._profiles.get(self.profile_combo_box.currentText())
+            st = self._current_profile
             self._ftp = UtfFTP(host=st["host"], user=st["user"], passwd=st["password"])
             self._ftp.encoding = "utf-8"
             self.ftp_src_status_label.setText(self._ftp.getwelcome())
@@ -1455,9 +1836,15 @@ class MainWindow(MainUiWindow):
 
     # ******************** Control ********************* #
 
+    def on_remote_button_clicked(self, state):
+        self.on_remote_action(self._remote_actions[self.sender()])
+
     def on_remote_action(self, action):
         self._http_api.send(HttpAPI.Request.REMOTE, action)
 
+    def on_power_button_clicked(self, state):
+        self.on_power_action(self._power_actions[self.sender()])
+
     def on_power_action(self, action):
         self._http_api.send(HttpAPI.Request.POWER, action)
 
@@ -1475,7 +1862,14 @@ class MainWindow(MainUiWindow):
             self._http_api.send(HttpAPI.Request.GRUB)
 
     def on_volume_changed(self, value):
-        self._http_api.send(HttpAPI.Request.VOL, value)
+        self._volume_value = value
+        self._volume_timer.start()
+
+    def send_volume_request(self):
+        """ Sends the last volume value set. """
+        if self._volume_value is not None and self._http_api:
+            self._http_api.send(HttpAPI.Request.VOL, self._volume_value)
+            self._volume_value = None
 
     def update_screenshot(self, data):
         if "error_code" in data:
@@ -1491,19 +1885,43 @@ class MainWindow(MainUiWindow):
 
     @pyqtSlot()
     def update_state(self):
+        if self._state_request_pending:
+            elapsed = int((time.monotonic() - self._state_request_time) * 1000)
+            if elapsed < self._STATE_MAX_INTERVAL:
+                # The previous request is not completed yet. Checked again if the reply is lost.
+                self._update_state_timer.start(self._STATE_MAX_INTERVAL - elapsed)
+                return
+            self._state_request_pending = False  # The reply is considered lost.
+
+        if self.isMinimized() or not self.isVisible():
+            # Nothing to show. Resumed faster when the window is shown or restored.
+            self._update_state_timer.start(self._STATE_MAX_INTERVAL)
+            return
+
+        self._state_request_pending = True
+        self._state_request_time = time.monotonic()
         self._http_api.send(self._http_api.Request.INFO)
+        # Watchdog for a lost reply. Restarted with the polling interval by the reply.
+        self._update_state_timer.start(self._STATE_MAX_INTERVAL)
+
+    def resume_state_polling(self):
+        """ Resumes the state polling with the initial interval. """
+        if self._http_api:
+            self._state_interval = self._STATE_INTERVAL
+            self.update_state()
 
     def update_state_info(self, info):
+        self._state_request_pending = False
         info_text = "Connection status: {}. {}"
         model, e2_ver, img_ver, def_str = None, None, None, "N/A"
 
         if info and not info.get("error", None):
             image = info.get("e2distroversion", def_str)
             model = info.get("e2model", def_str)
-            self.status_bar.showMessage(info_text.format("OK", f"Current Box: {model} Image: {image}"))
+            self.show_status_message(info_text.format("OK", f"Current Box: {model} Image: {image}"))
             e2_ver, img_ver = info.get("e2enigmaversion", def_str), info.get("e2imageversion", def_str)
         else:
-            self.status_bar.showMessage(info_text.format("Disconnected.", ""))
+            self.show_status_message(info_text.format("Disconnected.", ""))
             if all((self.log_action.isChecked(),
                     self.upload_tool_button.isEnabled(),
                     self.upload_tool_button.isEnabled())):
@@ -1513,10 +1931,23 @@ class MainWindow(MainUiWindow):
         self.model_label.setText(model or def_str)
         self.e2_version_label.setText(e2_ver or def_str)
         self.image_version_label.setText(img_ver or def_str)
+        # Polling is slowed down while the receiver state [including disconnected] is unchanged.
+        state = (model, e2_ver, img_ver)
+        if state == self._last_state and self.current_page is not Page.CONTROL:
+            self._state_interval = min(self._state_interval * 2, self._STATE_MAX_INTERVAL)
+        else:
+            self._state_interval = self._STATE_INTERVAL
+        self._update_state_timer.start(self._state_interval)
+        self._last_state = state
 
         if self.current_page is Page.CONTROL:
             self._http_api.send(HttpAPI.Request.SIGNAL)
 
+    def show_status_message(self, msg):
+        """ Shows the message in the status bar if it differs from the current one. """
+        if self.status_bar.currentMessage() != msg:
+            self.status_bar.showMessage(msg)
+
     def update_signal(self, sig):
         self.snr_progress_bar.setValue(int(sig.get("e2snr", "0 %").strip().rstrip("%N/A") or 0))
         self.ber_progress_bar.setValue(int((sig.get("e2ber", None) or "").strip().rstrip("N/A") or 0))
@@ -25,15 +25,53 @@ __all__ = ["ServicesModel", "FavModel", "BouquetsModel", "SatelliteModel", "Sate
 
 from PyQt5 import QtGui, QtWidgets, QtCore
 
+from app.enigma.ecommons import Service
 from app.ui.uicommons import Column
 
 
-class FilerModel(QtCore.QSortFilterProxyModel):
+class RowsAppender:
+    """ Additional class [mixin] for appending rows with a single model reset instead of signals for each row. """
+
+    def appendRows(self, rows):
+        self.update_rows(rows)
+
+    def reset_rows(self, rows=()):
+        """ Replaces all [source] rows with the given ones. """
+        self.update_rows(rows, True)
+
+    def update_rows(self, rows, clear=False):
+        model = self.sourceModel() if isinstance(self, QtCore.QSortFilterProxyModel) else self
+        model.beginResetModel()
+        model.blockSignals(True)
+        if clear:
+            model.removeRows(0, model.rowCount())
+        for row in rows:
+            model.appendRow(row)
+        model.blockSignals(False)
+        model.endResetModel()
+
+    def extend_rows(self, rows):
+        """ Appends rows with a single insert signal [keeps the current selection, unlike a model reset]. """
+        if not rows:
+            return
+
+        model = self.sourceModel() if isinstance(self, QtCore.QSortFilterProxyModel) else self
+        first = model.rowCount()
+        model.insertRows(first, len(rows))
+        model.blockSignals(True)
+        for r, row in enumerate(rows, first):
+            for c, item in enumerate(row):
+                model.setItem(r, c, item)
+        model.blockSignals(False)
+        model.dataChanged.emit(model.index(first, 0), model.index(model.rowCount() - 1, model.columnCount() - 1))
+
+
+class FilerModel(QtCore.QSortFilterProxyModel, RowsAppender):
     FILTER_COLUMNS = ()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = self.create_source_model()
         self.setSourceModel(self.model)
         self._filter_text = ""
         # Filter delay timer
@@ -41,6 +79,10 @@ class FilerModel(QtCore.QSortFilterProxyModel):
         self.filter_timer.setSingleShot(True)
         self.filter_timer.timeout.connect(self.filter)
 
+    def create_source_model(self):
+        """ Creates the source model. Can be overridden in subclasses. """
+        return QtGui.QStandardItemModel(self)
+
     def set_filter_text(self, text):
         """ Sets text for filter and starts delay timer. """
         self._filter_text = text
@@ -64,6 +106,73 @@ class FilerModel(QtCore.QSortFilterProxyModel):
         self.model.appendRow(*__args)
 
 
+class ServicesTableModel(QtCore.QAbstractTableModel):
+    """ Services source model. Stores Service tuples as is instead of items for each cell. """
+
+    def __init__(self, header_labels=(), *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._header_labels = header_labels
+        self._rows = []
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(Service._fields)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self._rows[index.row()][index.column()]
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+
+        row = index.row()
+        srv = self._rows[row]
+        self._rows[row] = srv._replace(**{srv._fields[index.column()]: value})
+        self.dataChanged.emit(index, index)
+        return True
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._header_labels[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | QtCore.Qt.ItemIsDragEnabled if index.isValid() else flags
+
+    def appendRows(self, rows):
+        """ Appends services with a single insert signal. """
+        if not rows:
+            return
+
+        count = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), count, count + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def reset_rows(self, rows=()):
+        """ Replaces all services with a single model reset. """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        if count <= 0 or row < 0 or row + count > len(self._rows):
+            return False
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
 class ServicesModel(FilerModel):
     HEADER_LABELS = ("", "", "", "Picon", "", "Name", "", "", "Package", "Type",
                      "SID", "Frec", "SR", "Pol", "FEC", "System", "Pos", "", "", "")
@@ -75,9 +184,11 @@ class ServicesModel(FilerModel):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.model.setHorizontalHeaderLabels(self.HEADER_LABELS)
         self._picon_path = ""
 
+    def create_source_model(self):
+        return ServicesTableModel(self.HEADER_LABELS, self)
+
     def data(self, index, role):
         column = index.column()
         if role == QtCore.Qt.DecorationRole and column == Column.PICON:
@@ -86,6 +197,20 @@ class ServicesModel(FilerModel):
             return QtCore.Qt.AlignCenter
         return super().data(index, role)
 
+    def appendRow(self, service):
+        self.model.appendRows((service,))
+
+    def appendRows(self, services):
+        self.model.appendRows(services)
+
+    def reset_rows(self, services=()):
+        self.model.reset_rows(services)
+
+    @property
+    def services(self):
+        """ Returns services in the source [unsorted and unfiltered] order. """
+        return self.model.rows
+
     @property
     def picon_path(self):
         return self._picon_path
@@ -95,7 +220,7 @@ class ServicesModel(FilerModel):
         self._picon_path = value
 
 
-class FavModel(QtGui.QStandardItemModel):
+class FavModel(QtGui.QStandardItemModel, RowsAppender):
     HEADER_LABELS = ("", "", "", "Picon", "", "Name", "", "", "", "Type", "", "", "", "", "", "", "Pos", "", "", "")
     CENTERED_COLUMNS = {Column.TYPE, Column.POS}
 
@@ -171,7 +296,7 @@ class SatelliteTransponderModel(FilerModel):
         return super().data(index, role)
 
 
-class PiconModel(QtCore.QSortFilterProxyModel):
+class PiconModel(QtCore.QSortFilterProxyModel, RowsAppender):
     HEADER_LABELS = ("Info", "", "Picon")
 
     def __init__(self, *args, **kwargs):
@@ -194,7 +319,7 @@ class PiconModel(QtCore.QSortFilterProxyModel):
         self.setFilterKeyColumn(Column.PICON_INFO)
 
 
-class EpgModel(QtGui.QStandardItemModel):
+class EpgModel(QtGui.QStandardItemModel, RowsAppender):
     HEADER_LABELS = ("Title", "Time", "Description", "Event")
 
     def __init__(self, *args, **kwargs):
@@ -202,7 +327,7 @@ class EpgModel(QtGui.QStandardItemModel):
         self.setHorizontalHeaderLabels(self.HEADER_LABELS)
 
 
-class TimerModel(QtGui.QStandardItemModel):
+class TimerModel(QtGui.QStandardItemModel, RowsAppender):
     HEADER_LABELS = ("Name", "Description", "Service", "Time", "Timer")
 
     def __init__(self, *args, **kwargs):
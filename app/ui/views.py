@@ -92,7 +92,8 @@ class BaseTableView(QtWidgets.QTableView):
         selection_model = self.selectionModel()
         removed = [i.row() for i in sorted(selection_model.selectedRows(), reverse=True)]
         self.removed.emit({r: model.index(r, Column.FAV_ID).data() for r in removed})
-        list(map(model.removeRow, removed))
+        for r in removed:
+            model.removeRow(r)
 
         if move_cursor:
             i = self.moveCursor(self.MoveDown, QtCore.Qt.ControlModifier)
@@ -149,7 +150,7 @@ class PiconAssignment(QtWidgets.QWidget):
 
         p_id = self.model().index(cur_index.row(), Column.PICON_ID).data()
         if p_id:
-            self.clipboard.setText(p_id.rstrip(".png"))
+            self.clipboard.setText(p_id[:-4] if p_id.endswith(".png") else p_id)
 
 
 class BaseTreeView(QtWidgets.QTreeView):
@@ -220,7 +221,8 @@ class BaseTreeView(QtWidgets.QTreeView):
         removed = [(i.row(), i.parent()) for i in sorted(selection_model.selectedRows(), reverse=True) if
                    (i.parent() and i.parent().row() >= 0) or root]
         self.removed.emit([[model.index(r[0], c, r[1]) for c in range(model.columnCount(r[1]))] for r in removed])
-        list(map(lambda r: model.removeRow(*r), removed))
+        for r in removed:
+            model.removeRow(*r)
 
         if move_cursor:
             i = self.moveCursor(self.MoveDown, QtCore.Qt.ControlModifier)
@@ -363,6 +365,8 @@ class FavView(BaseTableView, PiconAssignment, Searcher):
     locate_service = QtCore.pyqtSignal(str)
     insert_marker = QtCore.pyqtSignal()
     insert_space = QtCore.pyqtSignal()
+    # Called before anything is dropped [all rows must be in the model].
+    drag_entered = QtCore.pyqtSignal()
 
     class ContextMenu(QtWidgets.QMenu):
         def __init__(self, *args, **kwargs):
@@ -466,6 +470,10 @@ class FavView(BaseTableView, PiconAssignment, Searcher):
         if fav_id:
             self.locate_service.emit(fav_id)
 
+    def dragEnterEvent(self, event):
+        self.drag_entered.emit()
+        super().dragEnterEvent(event)
+
     def dropEvent(self, event):
         super().dropEvent(event)
         self.inserted.emit(True)